@@ -1,109 +1,108 @@
+from typing import Dict, Type
+
 from skellymodels.create_skeleton import create_skeleton_model
 from skellymodels.model_info.model_info import ModelInfo
+from skellymodels.model_info.mediapipe_model_info import MediapipeModelInfo
+from skellymodels.model_info.rigid_body_mediapipe_model_info import RigidMediapipeModelInfo
+from skellymodels.model_info.openpose_model_info import OpenPoseModelInfo
+from skellymodels.model_info.qualisys_model_info import (
+    QualisysModelInfo,
+    QualisysMDN_NIHModelInfo,
+    QualisysTF01ProstheticModelInfo,
+)
+
+
+MODEL_INFO_REGISTRY: Dict[str, Type[ModelInfo]] = {
+    "mediapipe": MediapipeModelInfo,
+    "rigid_mediapipe": RigidMediapipeModelInfo,
+    "openpose": OpenPoseModelInfo,
+    "qualisys": QualisysModelInfo,
+    "qualisys_mdn_nih": QualisysMDN_NIHModelInfo,
+    "qualisys_tf01": QualisysTF01ProstheticModelInfo,
+}
+
+
+def create_skeleton_model_from_name(model_name: str):
+    """
+    Creates a skeleton model for one of the models in MODEL_INFO_REGISTRY
+    Parameters:
+    - model_name: The registry key of the model (e.g. 'mediapipe', 'qualisys')
+    Returns:
+    - An instance of the Skeleton class that represents the complete skeletal model
+    """
+    if model_name not in MODEL_INFO_REGISTRY:
+        raise ValueError(f"Unknown model '{model_name}'. Available models are {list(MODEL_INFO_REGISTRY.keys())}.")
+
+    return create_skeleton_from_this_model_info(model_info=MODEL_INFO_REGISTRY[model_name]())
 
 
 def create_mediapipe_skeleton_model():
+    """
+    Creates a skeleton model using the mediapipe model
+    Returns:
+    - An instance of the Skeleton class that represents the complete skeletal model
+    """
+    return create_skeleton_model_from_name("mediapipe")
 
-        from skellymodels.model_info.mediapipe_model_info import MediapipeModelInfo 
-
-        """
-        Creates a skeleton model using the mediapipe model
-        Returns:
-        - An instance of the Skeleton class that represents the complete skeletal model 
-        """
-
-        skeleton_model = create_skeleton_from_this_model_info(
-            model_info=MediapipeModelInfo()
-        )
-
-        return skeleton_model
 
 def create_rigid_mediapipe_skeleton_model():
-    
-        from skellymodels.model_info.rigid_body_mediapipe_model_info import RigidMediapipeModelInfo
-
-        """
-        Creates a skeleton model using the mediapipe model
-        Returns:
-        - An instance of the Skeleton class that represents the complete skeletal model 
-        """
+    """
+    Creates a skeleton model using the rigid body mediapipe model
+    Returns:
+    - An instance of the Skeleton class that represents the complete skeletal model
+    """
+    return create_skeleton_model_from_name("rigid_mediapipe")
 
-        skeleton_model = create_skeleton_from_this_model_info(
-            model_info=RigidMediapipeModelInfo()
-        )
-
-        return skeleton_model
 
 def create_openpose_skeleton_model():
-        
-        from skellymodels.model_info.openpose_model_info import OpenPoseModelInfo
-
-        """
-        Creates a skeleton model using the openpose model
-        Returns:
-        - An instance of the Skeleton class that represents the complete skeletal model 
-        """
-
-        skeleton_model = create_skeleton_from_this_model_info(
-            model_info=OpenPoseModelInfo()
-        )
-
-        return skeleton_model
+    """
+    Creates a skeleton model using the openpose model
+    Returns:
+    - An instance of the Skeleton class that represents the complete skeletal model
+    """
+    return create_skeleton_model_from_name("openpose")
 
 
 def create_qualisys_skeleton_model():
-    
-        from skellymodels.model_info.qualisys_model_info import QualisysModelInfo
-    
-        """
-        Creates a skeleton model using the qualisys model
-        Returns:
-        - An instance of the Skeleton class that represents the complete skeletal model 
-        """
-
-        skeleton_model = create_skeleton_from_this_model_info(
-            model_info=QualisysModelInfo()
-        )
-        
-        return skeleton_model
+    """
+    Creates a skeleton model using the qualisys model
+    Returns:
+    - An instance of the Skeleton class that represents the complete skeletal model
+    """
+    return create_skeleton_model_from_name("qualisys")
 
 
 def create_qualisys_mdn_nih_skeleton_model():
-      
-      from skellymodels.model_info.qualisys_model_info import QualisysMDN_NIHModelInfo
+    """
+    Creates a skeleton model using the qualisys MDN NIH model
+    Returns:
+    - An instance of the Skeleton class that represents the complete skeletal model
+    """
+    return create_skeleton_model_from_name("qualisys_mdn_nih")
 
-      skeleton_model = create_skeleton_from_this_model_info(
-            model_info=QualisysMDN_NIHModelInfo()
-      )
-
-      return skeleton_model
 
 def create_qualisys_tf01_skeleton_model():
-
-        from skellymodels.model_info.qualisys_model_info import QualisysTF01ProstheticModelInfo
-
-        skeleton_model = create_skeleton_from_this_model_info(
-            model_info=QualisysTF01ProstheticModelInfo()
-        )
-
-        return skeleton_model
-
-
-
-def create_skeleton_from_this_model_info(model_info:ModelInfo):
-      
-        """
-        Creates a skeleton model using the qualisys model
-        Returns:
-        - An instance of the Skeleton class that represents the complete skeletal model 
-        """
-
-        skeleton_model = create_skeleton_model(actual_markers=model_info.landmark_names, 
-                        num_tracked_points=model_info.num_tracked_points,
-                        segment_connections=model_info.segment_connections,
-                        virtual_markers=model_info.virtual_markers_definitions,
-                        joint_hierarchy= model_info.joint_hierarchy,
-                        center_of_mass_info=model_info.center_of_mass_definitions
-                    )   
-        
-        return skeleton_model
+    """
+    Creates a skeleton model using the qualisys TF01 prosthetic model
+    Returns:
+    - An instance of the Skeleton class that represents the complete skeletal model
+    """
+    return create_skeleton_model_from_name("qualisys_tf01")
+
+
+def create_skeleton_from_this_model_info(model_info: ModelInfo):
+    """
+    Creates a skeleton model using the given model info
+    Returns:
+    - An instance of the Skeleton class that represents the complete skeletal model
+    """
+
+    skeleton_model = create_skeleton_model(actual_markers=model_info.landmark_names,
+                    num_tracked_points=model_info.num_tracked_points,
+                    segment_connections=model_info.segment_connections,
+                    virtual_markers=model_info.virtual_markers_definitions,
+                    joint_hierarchy= model_info.joint_hierarchy,
+                    center_of_mass_info=model_info.center_of_mass_definitions
+                )
+
+    return skeleton_model
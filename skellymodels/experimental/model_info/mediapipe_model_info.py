@@ -1,10 +1,12 @@
 import json
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Union
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List, Dict, Optional, Union
 
 
-@dataclass
-class ModelInfo(dict):
+@dataclass(frozen=True)
+class ModelInfo:
     name: str
     tracker_name: str
     landmark_names: List[str]
@@ -16,10 +18,17 @@ class ModelInfo(dict):
     joint_hierarchy: Optional[Dict[str, List[str]]] = None
 
 
+MEDIAPIPE_CONFIG_PATH = Path(__file__).parent / 'mediapipe_config.json'
+
+
+@lru_cache(maxsize=1)
+def _load_mediapipe_config() -> Dict[str, Any]:
+    return json.loads(MEDIAPIPE_CONFIG_PATH.read_bytes())
+
+
 class MediapipeModel:
     def __init__(self):
-        with open('skellymodels/experimental/model_info/mediapipe_config.json') as f:
-            model_info = json.load(f)
+        model_info = _load_mediapipe_config()
 
         self.name = model_info['name']
         self.aspects = {}
@@ -40,5 +49,10 @@ class MediapipeModel:
 
 
 
-mediapipe_model = MediapipeModel()
-f = 2
\ No newline at end of file
+def __getattr__(name: str):
+    # Build the module-level model on first access instead of at import
+    if name == 'mediapipe_model':
+        global mediapipe_model
+        mediapipe_model = MediapipeModel()
+        return mediapipe_model
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
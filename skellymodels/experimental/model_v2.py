@@ -1,48 +1,38 @@
-from typing import Dict, Any, List, Optional, Union
+import logging
+from typing import Dict, List, Optional, Union
 from dataclasses import dataclass
-from skellymodels.experimental.validators import (LandmarkValidator, 
-                                                  VirtualMarkerValidator, 
-                                                  SegmentConnectionsValidator,
-                                                  CenterOfMassValidator)
-from skellymodels.model_info.qualisys_model_info import QualisysModelInfo
+from functools import cached_property
+from skellymodels.experimental.validators import (validate_landmark_names,
+                                                  validate_virtual_markers,
+                                                  validate_segment_connections,
+                                                  validate_center_of_mass)
 from skellymodels.model_info.mediapipe_model_info import MediapipeModelInfo
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
     
-@dataclass
+@dataclass(frozen=True)
 class AnatomicalStructure:
     landmark_names: List[str]
     virtual_markers_definitions: Optional[Dict[str, Dict[str, List[Union[float, str]]]]] = None
     segment_connections: Optional[Dict[str, Dict[str, str]]] = None
     center_of_mass_definitions: Optional[Dict[str, Dict[str, float]]] = None
 
-    @property
+    @cached_property
     def marker_names(self):
-        markers = self.landmark_names.copy()
         if self.virtual_markers_definitions:
-            markers.extend(self.virtual_markers_definitions.keys())
-        return markers
+            return (*self.landmark_names, *self.virtual_markers_definitions)
+        return tuple(self.landmark_names)
     
-    @property
+    @cached_property
     def virtual_marker_names(self):
         if not self.virtual_markers_definitions:
-            return []
-        return list(self.virtual_markers_definitions.keys())
+            return ()
+        return tuple(self.virtual_markers_definitions.keys())
     
 
 
-from pydantic import BaseModel, model_validator, ConfigDict
-
-class TrajectoryValidator(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-    data:np.ndarray
-    marker_names: List[str]
-
-    @model_validator(mode="after")
-    def validate_data(self):
-        if self.data.shape[1] != len(self.marker_names):
-            raise ValueError(f"Trajectory data must have the same number of markers as input name list. Data has {self.data.shape[1]} markers and list has {len(self.marker_names)} markers.")
-
 class Trajectory:
     def __init__(self, name: str, data: np.ndarray, marker_names: List[str], virtual_marker_definitions: Dict = None):
         self.name = name
@@ -54,21 +44,22 @@ class Trajectory:
         
         
     def _validate_data(self, data: np.ndarray, marker_names: List[str]):
-        TrajectoryValidator(data=data, marker_names= marker_names)
+        if data.shape[1] != len(marker_names):
+            raise ValueError(f"Trajectory data must have the same number of markers as input name list. Data has {data.shape[1]} markers and list has {len(marker_names)} markers.")
 
     def _set_trajectory_data(self, data:np.ndarray, marker_names:List[str], virtual_marker_definitions: Dict = None):
         self._trajectories.update({marker_name: data[:, i, :] for i, marker_name in enumerate(marker_names)})
         
         if virtual_marker_definitions:
-            print(f'Calculating virtual markers: {list(virtual_marker_definitions.keys())}')
-            virtual_marker_data = {}
+            logger.debug('Calculating virtual markers: %s', list(virtual_marker_definitions.keys()))
             for vm_name, vm_info in virtual_marker_definitions.items():
-                vm_positions = np.zeros((data.shape[0], 3))
-                for marker_name, weight in zip(vm_info["marker_names"], vm_info["marker_weights"]):
+                # earlier virtual markers are already in self._trajectories, which resolves chained definitions
+                component_names = vm_info["marker_names"]
+                component_weights = vm_info["marker_weights"]
+                vm_positions = self._trajectories[component_names[0]] * float(component_weights[0])
+                for marker_name, weight in zip(component_names[1:], component_weights[1:]):
                     vm_positions += self._trajectories[marker_name] * weight
-                virtual_marker_data[vm_name] = vm_positions
-
-            self._trajectories.update(virtual_marker_data)
+                self._trajectories[vm_name] = vm_positions
 
     @property
     def trajectories(self):
@@ -76,7 +67,7 @@ class Trajectory:
     
     @property 
     def landmark_trajectories(self):
-        return {marker_name:trajectory for marker_name, trajectory in self._trajectories.items() if marker_name in self._marker_names}
+        return {marker_name: self._trajectories[marker_name] for marker_name in self._marker_names}
     
     @property
     def virtual_marker_trajectories(self):
@@ -102,34 +93,33 @@ class AnatomicalStructureBuilder:
     def _marker_names(self):
         if not self.landmark_names:
             raise ValueError("Landmark names must be set before calling for a marker list.")
-        markers = self.landmark_names.copy()
         if self.virtual_markers_definitions:
-            markers.extend(self.virtual_markers_definitions.keys())
-        return markers
+            return [*self.landmark_names, *self.virtual_markers_definitions]
+        return self.landmark_names
 
     def with_landmarks(self, landmark_names: List[str]):
-        LandmarkValidator(landmark_names=landmark_names)
+        validate_landmark_names(landmark_names=landmark_names)
         self.landmark_names = landmark_names.copy()
         return self
     
     def with_virtual_markers(self, virtual_marker_definitions: Dict[str, Dict[str, List[Union[float, str]]]]):
         if not self.landmark_names:
             raise ValueError("Landmark names must be set before adding virtual markers.")
-        VirtualMarkerValidator(virtual_markers=virtual_marker_definitions,
-                               landmark_names=self.landmark_names)
+        validate_virtual_markers(virtual_markers=virtual_marker_definitions,
+                                 landmark_names=self.landmark_names)
         self.virtual_markers_definitions = virtual_marker_definitions
         return self
     
     def with_segment_connections(self, segment_connections: Dict[str, Dict[str, str]]):
-        SegmentConnectionsValidator(segment_connections=segment_connections,
-                                    marker_names=self._marker_names)
+        validate_segment_connections(segment_connections=segment_connections,
+                                     marker_names=self._marker_names)
         self.segment_connections = segment_connections
         return self
     
     def with_center_of_mass(self, center_of_mass_definitions: Dict[str, Dict[str, float]]):
         if not self.segment_connections:
             raise ValueError("Segment connections must be set before adding center of mass definitions")
-        CenterOfMassValidator(center_of_mass_definitions=center_of_mass_definitions,
+        validate_center_of_mass(center_of_mass_definitions=center_of_mass_definitions,
                                 segment_connections=self.segment_connections)
         self.center_of_mass_definitions = center_of_mass_definitions
         return self
@@ -170,6 +160,8 @@ class Aspect:
 
 
 class Actor:
+    __slots__ = ("name", "aspects")
+
     def __init__(self, name: str):
         self.name = name
         self.aspects = {}
@@ -194,18 +186,19 @@ class Actor:
 
 
 class Human(Actor):
-    pass 
+    __slots__ = ()
 
 from pathlib import Path
 path_to_data = Path(r"C:\Users\Aaron\FreeMocap_Data\recording_sessions\freemocap_test_data\output_data\mediapipe_body_3d_xyz.npy")
 
 
 human = Actor(name="mediapipe")
+mediapipe_model_info = MediapipeModelInfo()
 body_structure = (AnatomicalStructureBuilder()
-             .with_landmarks(MediapipeModelInfo().landmark_names)
-             .with_virtual_markers(MediapipeModelInfo().virtual_markers_definitions)
-             .with_segment_connections(MediapipeModelInfo().segment_connections)
-             .with_center_of_mass(MediapipeModelInfo().center_of_mass_definitions)
+             .with_landmarks(mediapipe_model_info.landmark_names)
+             .with_virtual_markers(mediapipe_model_info.virtual_markers_definitions)
+             .with_segment_connections(mediapipe_model_info.segment_connections)
+             .with_center_of_mass(mediapipe_model_info.center_of_mass_definitions)
              .build()
 )
 
@@ -217,4 +210,3 @@ body.add_landmark_trajectories(data)
 
 human.add_aspect(body)
 human.get_data(aspect_name = 'body', type='main')
-f = 2
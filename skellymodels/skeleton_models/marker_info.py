@@ -53,9 +53,11 @@ class MarkerInfo(BaseModel):
     def add_virtual_markers(self, virtual_markers_dict: Dict[str, Dict[str, List[Union[float, str]]]]):
         """Add virtual markers and update _all_markers."""
         self.virtual_marker_definition = VirtualMarkerInfo(virtual_markers=virtual_markers_dict)
+        existing_markers = set(self.all_markers)
         for virtual_marker_name in self.virtual_marker_definition.virtual_markers.keys():
-            if virtual_marker_name not in self.all_markers:
+            if virtual_marker_name not in existing_markers:
                 self.all_markers.append(virtual_marker_name)
+                existing_markers.add(virtual_marker_name)
 
     @property
     def all_markers(self) -> List[str]:
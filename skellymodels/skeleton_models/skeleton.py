@@ -6,6 +6,8 @@ from skellymodels.skeleton_models.marker_info import MarkerInfo
 from skellymodels.skeleton_models.segments import Segment, Segments, SegmentAnthropometry
 import json
 
+logger = logging.getLogger(__name__)
+
 
 class Skeleton(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -41,11 +43,12 @@ class Skeleton(BaseModel):
         Parameters:
         - joint_hierarchy: A dictionary with joint names as keys and lists of connected marker names as values.
         """
+        marker_name_set = set(self.markers.all_markers)
         for joint_name, joint_connections in joint_hierarchy.items():
-            if joint_name not in self.markers.all_markers:
+            if joint_name not in marker_name_set:
                 raise ValueError(f"The joint {joint_name} is not in the list of markers or virtual markers.")
             for connected_marker in joint_connections:
-                if connected_marker not in self.markers.all_markers:
+                if connected_marker not in marker_name_set:
                     raise ValueError(
                         f"The connected marker {connected_marker} for {joint_name} is not in the list of markers or virtual markers."
                     )
@@ -91,7 +94,7 @@ class Skeleton(BaseModel):
         try:
             self.calculate_virtual_markers()
         except ValueError:
-            print(
+            logger.info(
                 "Freemocap data integrated without virtual markers, as no virtual marker definition was provided"
             )
 
@@ -134,8 +137,11 @@ class Skeleton(BaseModel):
         
         virtual_marker_data = {}
         for vm_name, vm_info in self.markers.virtual_marker_definition.virtual_markers.items():
-            vm_positions = np.zeros((self.num_frames, 3))
-            for marker_name, weight in zip(vm_info["marker_names"], vm_info["marker_weights"]):
+            marker_names = vm_info["marker_names"]
+            marker_weights = vm_info["marker_weights"]
+            # float() keeps integer data from truncating
+            vm_positions = self._marker_data[marker_names[0]] * float(marker_weights[0])
+            for marker_name, weight in zip(marker_names[1:], marker_weights[1:]):
                 vm_positions += self._marker_data[marker_name] * weight
             virtual_marker_data[vm_name] = vm_positions
 
@@ -154,22 +160,29 @@ class Skeleton(BaseModel):
         distal_trajectories = self.trajectories.get(segment.distal)
         return {"proximal": proximal_trajectories, "distal": distal_trajectories}
 
+    def _stack_marker_data(self, marker_names: List[str]) -> np.ndarray:
+        """Copies the trajectories for the given markers into a preallocated (num_frames, num_markers, 3) array."""
+        marker_dtypes = {self._marker_data[marker_name].dtype for marker_name in marker_names}
+        # keep float32 only when every trajectory is already floating; integer or mixed input is promoted to float64
+        if marker_dtypes and all(np.issubdtype(marker_dtype, np.floating) for marker_dtype in marker_dtypes):
+            dtype = np.result_type(*marker_dtypes, np.float32)
+        else:
+            dtype = np.float64
+        data_array = np.empty((self.num_frames, len(marker_names), 3), dtype=dtype)
+        for i, marker_name in enumerate(marker_names):
+            data_array[:, i, :] = self._marker_data[marker_name]
+        return data_array
+
     @property
     def marker_data_as_numpy(self) -> np.ndarray:
         """
         Converts the marker data dictionary to a NumPy array in (frame, marker, dimension) format.
 
         Returns:
-        - A NumPy array with dimensions (num_frames, num_markers, 3).
+        - A NumPy array with dimensions (num_frames, num_markers, 3). float32 data stays float32 and integer data
+          comes back as float64.
         """
-        marker_names = self.marker_names
-        num_frames = self.num_frames
-        num_markers = len(marker_names)
-        data_array = np.zeros((num_frames, num_markers, 3))
-
-        for i, marker_name in enumerate(marker_names):
-            data_array[:, i, :] = self._marker_data[marker_name]
-        return data_array
+        return self._stack_marker_data(self.marker_names)
 
     
     @property
@@ -178,15 +191,10 @@ class Skeleton(BaseModel):
         Converts the original marker data dictionary to a NumPy array in (frame, marker, dimension) format.
 
         Returns:
-        - A NumPy array with dimensions (num_frames, num_markers, 3).
+        - A NumPy array with dimensions (num_frames, num_markers, 3). float32 data stays float32 and integer data
+          comes back as float64.
         """
-        marker_names = self.original_marker_names
-        num_frames = self.num_frames
-        num_markers = len(marker_names)
-        data_array = np.zeros((num_frames, num_markers, 3))
-        for i, marker_name in enumerate(marker_names):
-            data_array[:, i, :] = self._marker_data[marker_name]
-        return data_array
+        return self._stack_marker_data(self.original_marker_names)
 
     @property
     def trajectories(self) -> Dict[str, np.ndarray]:
@@ -211,7 +219,7 @@ class Skeleton(BaseModel):
         try:
             return list(self.markers.virtual_marker_definition.virtual_markers.keys())
         except AttributeError:
-            print('Virtual marker names are not available. No virtual markers are defined.')
+            logger.debug('Virtual marker names are not available. No virtual markers are defined.')
             return []
         
 